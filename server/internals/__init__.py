@@ -2,5 +2,5 @@
 Initializes the internals package.
 """
 
-from .config import Config
+from .config import Config, getConfig
 from .database import Database
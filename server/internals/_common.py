@@ -2,23 +2,51 @@
 Common functions and classes used by several modules in internals. Not meant to be used directly.
 """
 # Standard Library Imports
+from base64 import urlsafe_b64encode
 from datetime import timedelta, datetime
+from functools import lru_cache
+from hashlib import sha256
+from hmac import new as hmacNew
+from time import time
 
 # Third Party Imports
-from jose import jwt
+from orjson import dumps
+
+# The static JWT header is identical for every token, so encode it once at import time
+_HEADER_B64: bytes = urlsafe_b64encode(b'{"alg":"HS256","typ":"JWT"}').rstrip(b"=")
+
+
+@lru_cache(maxsize=4)
+def _key(secretKey: str) -> bytes:
+    """
+    Returns the encoded signing key for the given secret.
+
+    The encode happens once per distinct secret rather than on every token signing.
+
+    Args:
+        secretKey (str): The secret key.
+
+    Returns:
+        bytes: The encoded signing key.
+    """
+    return secretKey.encode()
 
 
 def _makeAccessToken(
         data: dict,
-        expires: timedelta,
+        expires: timedelta | int,
         secretKey: str
 ) -> tuple[str, datetime]:
     """
     Makes an access token.
 
+    Signs the HS256 token directly with hmac rather than going through a JWT library, reusing the
+    precomputed header and cached signing key on every call.
+
     Args:
         data (dict): The data to include in the token.
-        expires (timedelta): The time until the token expires.
+        expires (timedelta | int): The time until the token expires. Passing the precomputed number
+            of seconds (Config.tokenExpireSeconds) skips the timedelta conversion.
 
     Returns:
         tuple[str, datetime]: The access token and the expiration time.
@@ -26,16 +54,17 @@ def _makeAccessToken(
     # Copy the data
     toEncode: dict = data.copy()
 
-    # Add the expiration time
-    expireTime = datetime.utcnow() + expires
-    toEncode["exp"] = expireTime
+    # Add the expiration time as an integer NumericDate (RFC 7519), avoiding datetime arithmetic
+    expireSeconds: int = expires if isinstance(expires, int) else int(expires.total_seconds())
+    expTimestamp: int = int(time()) + expireSeconds
+    toEncode["exp"] = expTimestamp
+
+    # Encode the payload and sign
+    body: bytes = urlsafe_b64encode(dumps(toEncode)).rstrip(b"=")  # orjson emits compact bytes directly
+    signingInput: bytes = _HEADER_B64 + b"." + body
+    signature: bytes = hmacNew(_key(secretKey), signingInput, sha256).digest()
 
-    # Encode the token
     return (
-        jwt.encode(
-            toEncode,
-            secretKey,
-            algorithm="HS256"
-        ),
-        expireTime
+        (signingInput + b"." + urlsafe_b64encode(signature).rstrip(b"=")).decode(),
+        datetime.fromtimestamp(expTimestamp)  # Built once for callers that store the expiry
     )
@@ -1,7 +1,9 @@
 """
 The config module.
 """
+from dataclasses import dataclass
 from datetime import timedelta
+from functools import lru_cache
 # Standard Library Imports
 from os import environ
 
@@ -9,40 +11,86 @@ from os import environ
 from dotenv import load_dotenv as loadDotEnv
 
 
+@lru_cache(maxsize=1)
+def _loadEnv() -> dict[str, str]:
+    """
+    Loads the .env file and snapshots the environment.
+
+    The parse happens exactly once per process; later Config instantiations reuse the cached snapshot
+    instead of re-reading the file from disk.
+
+    Returns:
+        dict[str, str]: A snapshot of the environment variables.
+    """
+    loadDotEnv()
+    return dict(environ)
+
+
+@dataclass(slots=True, frozen=True)
 class Config:
     """
     Configuration class for the server.
+
+    Frozen and slotted: attribute reads skip the instance dict and the instance is safe to share
+    across threads. Build instances with Config.fromEnv (or the getConfig singleton).
     """
-    # Type hints
     dbIp: str
     dbPort: str
     dbName: str
     dbUser: str
     dbPassword: str
+    dbPoolMin: int
+    dbPoolMax: int
     jwtSecret: str
+    jwtSecretBytes: bytes
+    argon2TimeCost: int
+    argon2MemoryCost: int
+    argon2Parallelism: int
 
     tokenExpireTime: timedelta  # Abstracting the token expiration time for ease of use
+    tokenExpireSeconds: int  # Same value as an int for the token-minting hot path
 
-    def __init__(self) -> None:
+    @classmethod
+    def fromEnv(cls) -> "Config":
         """
-        Initializes the Config object.
+        Builds a Config from the environment.
 
         Returns:
-            None
+            Config: The configuration object.
         """
-        # Load the environment variables
-        loadDotEnv()
-
-        # Set the database variables
-        self.dbIp = environ.get("DB_IP")
-        self.dbPort = environ.get("DB_PORT")
-        self.dbName = environ.get("DB_NAME")
-        self.dbUser = environ.get("DB_USER")
-        self.dbPassword = environ.get("DB_PASS")
-        self.jwtSecret = environ.get("SECRET_KEY")
-
-        # Set the token expiration time
-        self.tokenExpireTime = timedelta(
-            days=int(environ.get("TOKEN_EXPIRE_DAYS")),
-            minutes=int(environ.get("TOKEN_EXPIRE_MINUTES"))
+        # Load the environment variables (cached after the first call)
+        envs: dict[str, str] = _loadEnv()
+
+        jwtSecret: str = envs.get("SECRET_KEY")
+        tokenExpireTime: timedelta = timedelta(
+            days=int(envs.get("TOKEN_EXPIRE_DAYS")),
+            minutes=int(envs.get("TOKEN_EXPIRE_MINUTES"))
         )
+
+        return cls(
+            dbIp=envs.get("DB_IP"),
+            dbPort=envs.get("DB_PORT"),
+            dbName=envs.get("DB_NAME"),
+            dbUser=envs.get("DB_USER"),
+            dbPassword=envs.get("DB_PASS"),
+            dbPoolMin=int(envs.get("DB_POOL_MIN", 1)),
+            dbPoolMax=int(envs.get("DB_POOL_MAX", 10)),
+            jwtSecret=jwtSecret,
+            jwtSecretBytes=jwtSecret.encode() if jwtSecret is not None else None,  # Encoded once here so signing/verifying skips it
+            argon2TimeCost=int(envs.get("ARGON2_TIME_COST", 2)),
+            argon2MemoryCost=int(envs.get("ARGON2_MEMORY_COST", 65536)),
+            argon2Parallelism=int(envs.get("ARGON2_PARALLELISM", 2)),
+            tokenExpireTime=tokenExpireTime,
+            tokenExpireSeconds=int(tokenExpireTime.total_seconds())
+        )
+
+
+@lru_cache(maxsize=1)
+def getConfig() -> Config:
+    """
+    Returns the process-wide Config singleton.
+
+    Returns:
+        Config: The configuration object.
+    """
+    return Config.fromEnv()
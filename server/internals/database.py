@@ -2,19 +2,22 @@
 Database module for the server
 """
 # Standard Library Imports
-from typing import List
+from contextlib import contextmanager
+from time import monotonic
+from typing import Generator, Iterator
 from multiprocessing import Process
 
 # Third Party Imports
-from passlib.context import CryptContext
-from psycopg2 import connect
+from psycopg2 import OperationalError, errors
 from psycopg2.extensions import connection as Connection
 from psycopg2.extras import RealDictCursor, RealDictRow
+from psycopg2.pool import ThreadedConnectionPool
 
 # Local Imports
 from ._common import _makeAccessToken
 from .config import Config
 from .datatypes.db import User, Game
+from .datatypes.db.user import _argon2Hasher
 from .logging import SuppressedLoggerAdapter, createLogger
 
 
@@ -26,7 +29,45 @@ class Database:
     _logger: SuppressedLoggerAdapter
     _config: Config
     _connection: Connection
-    _context: CryptContext = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    _loggerConnection: Connection
+    _pool: ThreadedConnectionPool
+
+    # How long streamed users/games listings may be served from cache before re-querying
+    _LIST_CACHE_TTL: float = 5.0
+
+    # Connections idle for longer than this are pinged with SELECT 1 before reuse
+    _PRE_PING_IDLE: float = 60.0
+
+    # Server-side prepared statements, created once per pooled connection so hot queries skip parse/plan
+    _PREPARED: dict[str, str] = {
+        "getuser_by_token": """
+            PREPARE getuser_by_token (text) AS
+            SELECT users.id, users.created_at, users.uuid, users.email, users.password, users.username, users.access_level, users.refresh_token, users.oauth_scopes FROM users
+            JOIN tokens ON tokens.user_id = users.id  /* Join users table and tokens table to get user data */
+            WHERE tokens.token = $1
+            """,
+        "getuser_by_id": """
+            PREPARE getuser_by_id (integer) AS
+            SELECT id, created_at, uuid, email, password, username, access_level, refresh_token, oauth_scopes FROM users WHERE id = $1
+            """,
+        "getuser_by_uuid": """
+            PREPARE getuser_by_uuid (uuid) AS
+            SELECT id, created_at, uuid, email, password, username, access_level, refresh_token, oauth_scopes FROM users WHERE uuid = $1
+            """,
+        "getuser_by_email": """
+            PREPARE getuser_by_email (text) AS
+            SELECT id, created_at, uuid, email, password, username, access_level, refresh_token, oauth_scopes FROM users WHERE email = $1
+            """,
+        "getuser_by_refresh_token": """
+            PREPARE getuser_by_refresh_token (text) AS
+            SELECT id, created_at, uuid, email, password, username, access_level, refresh_token, oauth_scopes FROM users WHERE refresh_token = $1
+            """,
+        "getgame": """
+            PREPARE getgame (integer, uuid) AS
+            SELECT id, created_at, board_key, board_width, board_height, time FROM games
+            WHERE id = $1 OR uuid = $2
+            """
+    }
 
     def __init__(
             self,
@@ -42,24 +83,167 @@ class Database:
             None
         """
         self._config = config
-        self._connection = connect(
+        self._pool = ThreadedConnectionPool(
+            minconn=config.dbPoolMin,
+            maxconn=config.dbPoolMax,
             dbname=config.dbName,
             user=config.dbUser,
             password=config.dbPassword,
             host=config.dbIp,
-            port=config.dbPort
+            port=config.dbPort,
+            # TCP keepalives so firewalled-out idle connections are detected by libpq, not mid-request
+            keepalives=1,
+            keepalives_idle=30,
+            keepalives_interval=10,
+            keepalives_count=3
         )
+
+        # Tracks which pooled connections already have the prepared statements
+        self._preparedConnections: set[int] = set()
+
+        # Read-through cache for the users/games listings, keyed by table name
+        self._listCache: dict[str, tuple[float, list]] = {}
+
+        # When each pooled connection was last returned, for the pre-ping check
+        self._lastUsed: dict[int, float] = {}
+
+        # Keep one long-lived connection out of the pool for the data type objects
+        self._connection = self._pool.getconn()
+
+        # The database log handler commits after every record; give it its own connection so
+        # those commits cannot flush another request's partial writes on the shared connection
+        self._loggerConnection = self._pool.getconn()
+
         # Create the logger
         self._logger = createLogger(
             "Database",
-            databaseConnection=self._connection
+            databaseConnection=self._loggerConnection
         )
 
-    def __del__(self) -> None:
+    def close(self) -> None:
+        """
+        Closes all connections in the pool.
+
+        Returns:
+            None
+        """
+        self._pool.closeall()
+
+    def __enter__(self) -> "Database":
+        """
+        Enters the context manager.
+
+        Returns:
+            Database: The database object.
+        """
+        return self
+
+    def __exit__(
+            self,
+            excType,
+            excValue,
+            traceback
+    ) -> None:
+        """
+        Exits the context manager, closing the pool.
+
+        Returns:
+            None
+        """
+        self.close()
+
+    @contextmanager
+    def _conn(self) -> Generator[Connection, None, None]:
+        """
+        Checks a connection out of the pool for the duration of a with block.
+
+        Connections that have sat idle past _PRE_PING_IDLE are pinged first and replaced if dead, so
+        a silently dropped connection costs a reconnect here instead of a failed request.
+
+        Yields:
+            Connection: A connection from the pool.
+        """
+        connection: Connection = self._pool.getconn()
+
+        # Pre-ping stale connections before handing them out
+        if monotonic() - self._lastUsed.get(id(connection), 0.0) > self._PRE_PING_IDLE:
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute("SELECT 1")
+            except OperationalError:
+                self._preparedConnections.discard(id(connection))
+                self._lastUsed.pop(id(connection), None)
+                self._pool.putconn(connection, close=True)
+                connection = self._pool.getconn()
+
+        try:
+            self._prepare(connection)
+            yield connection
+        finally:
+            self._lastUsed[id(connection)] = monotonic()
+            self._pool.putconn(connection)
+
+    def _prepare(
+            self,
+            connection: Connection
+    ) -> None:
+        """
+        Creates the server-side prepared statements on a connection if not already done.
+
+        Args:
+            connection (Connection): The connection to prepare.
+
+        Returns:
+            None
+        """
+        if id(connection) in self._preparedConnections:
+            return
+
+        with connection.cursor() as cursor:
+            for statement in self._PREPARED.values():
+                cursor.execute(statement)
+
+        # Commit immediately: putconn rolls back open transactions, and PostgreSQL deallocates
+        # prepared statements created in a rolled-back transaction
+        connection.commit()
+
+        self._preparedConnections.add(id(connection))
+
+    def _executePrepared(
+            self,
+            connection: Connection,
+            statement: str,
+            args: tuple
+    ) -> tuple | None:
         """
-        Closes the database connection.
+        Runs a prepared-statement EXECUTE, re-preparing once if the server has lost them.
+
+        The _preparedConnections bookkeeping is only a fast path: connection ids are reused after
+        garbage collection, so the flag can be stale. Recovery keys on the server error itself,
+        which cannot lie.
+
+        Args:
+            connection (Connection): The connection to run the statement on.
+            statement (str): The EXECUTE statement.
+            args (tuple): The statement arguments.
+
+        Returns:
+            tuple | None: The first row of the result, if any.
         """
-        self._connection.close()
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(statement, args)
+                return cursor.fetchone()
+        except errors.InvalidSqlStatementName:
+            # Fresh session behind a reused id, or statements lost to a rollback; the failed
+            # statement aborted the transaction, so roll back before re-preparing
+            connection.rollback()
+            self._preparedConnections.discard(id(connection))
+            self._prepare(connection)
+
+            with connection.cursor() as cursor:
+                cursor.execute(statement, args)
+                return cursor.fetchone()
 
     """
 ===============================================================================================================================================================
@@ -77,6 +261,19 @@ class Database:
         """
         return self._connection
 
+    @property
+    def loggerConnection(self) -> Connection:
+        """
+        The dedicated connection for database log handlers.
+
+        Log handlers commit per record; isolating them here keeps those commits off the shared
+        request connection.
+
+        Returns:
+            Connection: The logging connection.
+        """
+        return self._loggerConnection
+
     """
 ===============================================================================================================================================================
         Users
@@ -84,26 +281,39 @@ class Database:
     """
 
     @property
-    def users(self) -> List[User]:
+    def users(self) -> Iterator[User]:
         """
-        Gets all users from the database.
+        Streams all users from the database.
+
+        Uses a server-side named cursor so rows are fetched in batches rather than materializing the
+        whole table, and allows callers to break early without draining the result set.
 
         Returns:
-            List[User]: A list of all users.
+            Iterator[User]: An iterator over all users.
         """
         self._logger.info("Getting all users")
 
-        # Get the cursor
-        cursor: RealDictCursor = self._connection.cursor(cursor_factory=RealDictCursor)
+        # Serve from the cache while it is fresh
+        cached: tuple[float, list] | None = self._listCache.get("users")
+        if cached is not None and monotonic() - cached[0] < self._LIST_CACHE_TTL:
+            yield from cached[1]
+            return
 
-        # Get the users
-        cursor.execute(
-            """
-            SELECT * FROM users
-            """
-        )
-        rows: List[RealDictRow] = cursor.fetchall()
-        return [User(row, self._connection, self._config) for row in rows]
+        # Stream the users, collecting them so a fully drained pass refreshes the cache
+        collected: list[User] = []
+        with self._conn() as connection, connection.cursor(name="users_stream", cursor_factory=RealDictCursor) as cursor:
+            cursor.itersize = 2000
+            cursor.execute(
+                """
+                SELECT * FROM users
+                """
+            )
+            for row in cursor:
+                user: User = User(row, self._connection, self._config)
+                collected.append(user)
+                yield user
+
+        self._listCache["users"] = (monotonic(), collected)
 
     def getUser(
             self,
@@ -124,41 +334,60 @@ class Database:
             refreshToken (str): The refresh token of the user.
         """
         # Ensure that at least one parameter is provided
-        if userId is None and uuid is None and email is None and token is None:
+        if userId is None and uuid is None and email is None and token is None and refreshToken is None:
             raise ValueError("At least one parameter must be provided.")
 
+        # %s-style args defer formatting until a handler actually emits the record
         self._logger.info(
-            f"Getting user with ID {userId}, UUID {uuid}, and email {email}, token {token}, and refresh token {refreshToken}")
+            "Getting user with ID %s, UUID %s, and email %s, token %s, and refresh token %s",
+            userId, uuid, email, token, refreshToken)
+
+        # Pick the single indexed predicate for the provided parameter so Postgres never falls back
+        # to an OR-across-columns sequential scan
+        if token is not None:
+            statement: str = "EXECUTE getuser_by_token (%s)"
+            args: tuple = (token,)
+        elif userId is not None:
+            statement = "EXECUTE getuser_by_id (%s)"
+            args = (userId,)
+        elif uuid is not None:
+            statement = "EXECUTE getuser_by_uuid (%s)"
+            args = (uuid,)
+        elif email is not None:
+            statement = "EXECUTE getuser_by_email (%s)"
+            args = (email,)
+        else:
+            statement = "EXECUTE getuser_by_refresh_token (%s)"
+            args = (refreshToken,)
+
+        with self._conn() as connection:
+            row: tuple | None = self._executePrepared(connection, statement, args)
 
-        # Attempt to get the user from the tokens table
-        with self._connection.cursor(cursor_factory=RealDictCursor) as cursor:
-            cursor.execute(
-                """
-                SELECT users.* FROM users
-                JOIN tokens ON tokens.user_id = users.id  /* Join users table and tokens table to get user data */
-                WHERE tokens.token = %s
-                """,
-                (token,)
-            )
-            row: RealDictRow = cursor.fetchone()  # Get the user from the tokens table
+        if row is not None:
+            return User.fromRow(row, self._connection, self._config)
 
-        if row is not None:  # If the user was found in the tokens table
-            return User(row, self._connection, self._config)
+        return None
 
-        with self._connection.cursor(cursor_factory=RealDictCursor) as cursor:
-            cursor.execute(
-                """
-                SELECT * FROM users
-                WHERE id = %s OR uuid = %s OR email = %s OR refresh_token = %s
-                """,
-                (userId, uuid, email, refreshToken,)
-            )
-            row: RealDictRow = cursor.fetchone()
+    def getUserByToken(
+            self,
+            token: str
+    ) -> User | None:
+        """
+        Gets a user by access token.
 
-        if row is not None:
-            return User(row, self._connection, self._config)
+        Slim fast path for the auth middleware: no parameter dispatch and no per-call log
+        formatting, just the prepared token lookup.
 
-        return None
+        Args:
+            token (str): An access token of the user.
+
+        Returns:
+            User | None: The user the token belongs to, if any.
+        """
+        with self._conn() as connection:
+            row: tuple | None = self._executePrepared(connection, "EXECUTE getuser_by_token (%s)", (token,))
+
+        return User.fromRow(row, self._connection, self._config) if row is not None else None
 
     def addUser(
             self,
@@ -172,36 +401,46 @@ class Database:
         Returns:
             User: The user object.
         """
-        self._logger.info(f"Adding user with email {email} and username {username}")
-
-        with self._connection.cursor(cursor_factory=RealDictCursor) as cursor:
-            # Hash the password
-            password = self._context.hash(password)
-
-            # Add the user
-            cursor.execute(
-                """
-                INSERT INTO users (email, password, username, access_token)
-                VALUES (%s, %s, %s, %s)
-                RETURNING *
-                """,
-                (
-                    email,
-                    password,
-                    username,
-                    _makeAccessToken(
-                        {
-                            "sub": email
-                        },
-                        self._config.tokenExpireTime,
-                        self._config.jwtSecret
+        self._logger.info("Adding user with email %s and username %s", email, username)
+
+        # Hash with argon2id, the same scheme User.checkPassword verifies and upgrades to; new
+        # accounts never take the legacy fallback path
+        password = _argon2Hasher(
+            self._config.argon2TimeCost,
+            self._config.argon2MemoryCost,
+            self._config.argon2Parallelism
+        ).hash(password)
+
+        # A plain commit after the INSERT: toggling autocommit raises if the connection has an
+        # open transaction, which the pre-ping or first-use PREPARE path can leave behind
+        with self._conn() as connection:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    """
+                    INSERT INTO users (email, password, username, access_token)
+                    VALUES (%s, %s, %s, %s)
+                    RETURNING id, created_at, uuid, email, password, username, access_level, refresh_token, oauth_scopes
+                    """,
+                    (
+                        email,
+                        password,
+                        username,
+                        _makeAccessToken(
+                            {
+                                "sub": email
+                            },
+                            self._config.tokenExpireSeconds,
+                            self._config.jwtSecret
+                        )
                     )
                 )
-            )
-            row: RealDictRow = cursor.fetchone()
-            self._connection.commit()
+                row: tuple = cursor.fetchone()
+            connection.commit()
+
+        # A new user invalidates any cached listing
+        self._listCache.pop("users", None)
 
-        return User(row, self._connection, self._config)
+        return User.fromRow(row, self._connection, self._config)
 
     """
 ===============================================================================================================================================================
@@ -210,26 +449,39 @@ class Database:
     """
 
     @property
-    def games(self) -> List[Game]:
+    def games(self) -> Iterator[Game]:
         """
-        Gets all games from the database.
+        Streams all games from the database.
+
+        Uses a server-side named cursor so rows are fetched in batches rather than materializing the
+        whole table, and allows callers to break early without draining the result set.
 
         Returns:
-            List[Game]: A list of all games.
+            Iterator[Game]: An iterator over all games.
         """
         self._logger.info("Getting all games")
 
-        # Get the cursor
-        cursor: RealDictCursor = self._connection.cursor(cursor_factory=RealDictCursor)
+        # Serve from the cache while it is fresh
+        cached: tuple[float, list] | None = self._listCache.get("games")
+        if cached is not None and monotonic() - cached[0] < self._LIST_CACHE_TTL:
+            yield from cached[1]
+            return
 
-        # Get the games
-        cursor.execute(
-            """
-            SELECT * FROM games
-            """
-        )
-        rows: List[RealDictRow] = cursor.fetchall()
-        return [Game(row, self._connection, self._config) for row in rows]
+        # Stream the games, collecting them so a fully drained pass refreshes the cache
+        collected: list[Game] = []
+        with self._conn() as connection, connection.cursor(name="games_stream", cursor_factory=RealDictCursor) as cursor:
+            cursor.itersize = 2000
+            cursor.execute(
+                """
+                SELECT * FROM games
+                """
+            )
+            for row in cursor:
+                game: Game = Game(row, self._connection, self._config)
+                collected.append(game)
+                yield game
+
+        self._listCache["games"] = (monotonic(), collected)
 
     def getGame(
             self,
@@ -250,21 +502,13 @@ class Database:
         if gameId is None and uuid is None:
             raise ValueError("At least one parameter must be provided.")
 
-        self._logger.info(f"Getting game with ID {gameId} and UUID {uuid}")
-
-        # Get the cursor
-        cursor: RealDictCursor = self._connection.cursor(cursor_factory=RealDictCursor)
+        self._logger.info("Getting game with ID %s and UUID %s", gameId, uuid)
 
         # Get the game
-        cursor.execute(
-            """
-            SELECT * FROM games
-            WHERE id = %s OR uuid = %s
-            """,
-            (gameId, uuid)
-        )
-        row: RealDictRow = cursor.fetchone()
+        with self._conn() as connection:
+            row: tuple | None = self._executePrepared(connection, "EXECUTE getgame (%s, %s)", (gameId, uuid))
+
         if row is None:
             return None
 
-        return Game(row, self._connection, self._config)
+        return Game.fromRow(row, self._connection, self._config)
@@ -1,6 +1,8 @@
 """
-Initializes the database data types module.
+Initializes the datatypes module.
 """
 
-from server.internals.datatypes.db.user import User
-from server.internals.datatypes.db.game import Game
+# Local Imports
+from .board import Board
+from .cell import Cell
+from .game import Game
@@ -2,195 +2,180 @@
 Board data type.
 """
 # Standard Library Imports
-from random import random
+from typing import Sequence
+
+# Third Party Imports
+import numpy as np
+
+try:  # numba is optional; when present the scalar fallback compiles to a native loop
+    from numba import njit
+except ImportError:
+    njit = None
 
 # Local Imports
 from .cell import Cell
 
+# The 8 Moore neighbourhood offsets as (row, column) deltas
+_MOORE_OFFSETS: tuple[tuple[int, int], ...] = (
+    (-1, -1), (-1, 0), (-1, 1),
+    (0, -1), (0, 1),
+    (1, -1), (1, 0), (1, 1)
+)
+
 
-# Helper functions
-def decision(
-        probability: float
-) -> bool:
+def countAdjacentAll(
+        mines: np.ndarray,
+        width: int,
+        height: int
+) -> np.ndarray:
     """
-    Returns True with a probability of probability.
+    Counts the mines adjacent to every cell on the board in one pass.
+
+    Accumulates eight shifted copies of a zero-padded mine mask, so each neighbour direction is one
+    whole-board uint8 add instead of a per-cell Python loop; cells past the board edge count as zero.
 
     Args:
-        probability (float): The probability of returning True.
+        mines (np.ndarray): Flat uint8 array of cells, 1 where a cell contains a mine.
+        width (int): The width of the board.
+        height (int): The height of the board.
 
     Returns:
-        bool: True with a probability of probability.
+        np.ndarray: Flat uint8 array of adjacent mine counts, one per cell.
     """
-    return random() < probability
+    # Zero-pad one cell on every side so shifted views never wrap
+    padded: np.ndarray = np.zeros((height + 2, width + 2), dtype=np.uint8)
+    padded[1:-1, 1:-1] = mines.reshape(height, width)
 
+    # Accumulate the eight shifted views
+    adjacent: np.ndarray = np.zeros((height, width), dtype=np.uint8)
+    for rowDelta, columnDelta in _MOORE_OFFSETS:
+        adjacent += padded[1 + rowDelta:height + 1 + rowDelta, 1 + columnDelta:width + 1 + columnDelta]
 
-def countAdjacent(
-        cellBinary: list[bool],
+    return adjacent.ravel()
+
+
+def countAdjacentAllScalar(
+        mines: np.ndarray,
         width: int,
-        index: int
-) -> int:
+        height: int
+) -> np.ndarray:
     """
-    Returns the number of mines adjacent to the cell at index.
+    Scalar twin of countAdjacentAll, useful for debugging the vectorized path.
+
+    A flat bounds-checked loop with no positional branching; when numba is installed the loop is
+    jit-compiled to native code at first call.
 
     Args:
-        cellBinary (list[bool]): The list of cells.
+        mines (np.ndarray): Flat uint8 array of cells, 1 where a cell contains a mine.
         width (int): The width of the board.
-        index (int): The index of the cell.
+        height (int): The height of the board.
 
     Returns:
-        int: The number of mines adjacent to the cell at index.
+        np.ndarray: Flat uint8 array of adjacent mine counts, one per cell.
     """
-    # Subtract 1 from the width to account for 0-based indexing
-    # width -= 1
+    adjacent: np.ndarray = np.zeros(width * height, dtype=np.uint8)
 
-    # Pre-declare count and fetch index
-    count: int = 0
+    for row in range(height):
+        for column in range(width):
+            count: int = 0
+            for rowDelta, columnDelta in _MOORE_OFFSETS:
+                neighbourRow: int = row + rowDelta
+                neighbourColumn: int = column + columnDelta
+                if 0 <= neighbourRow < height and 0 <= neighbourColumn < width:
+                    count += mines[neighbourRow * width + neighbourColumn]
+            adjacent[row * width + column] = count
 
-    # Ensure that the index is within the bounds of the list
-    if index < 0 or index >= len(cellBinary):
-        raise ValueError("Index out of bounds")
+    return adjacent
 
-    # Ensure that the list forms any kind of rectangle
-    if len(cellBinary) % width != 0:
-        raise ValueError("List does not form a rectangle")
 
-    # Create list of indices to check. This should be a list of indices that are adjacent to the cell
+if njit is not None:
+    countAdjacentAllScalar = njit(cache=True)(countAdjacentAllScalar)
 
-    # TODO: Refactor this code to generate all indices and then remove the invalid ones
 
-    # Logic for corner cases
-    if index == 0:  # Top left
-        fetchIndex = [
-            1,  # Right
-            width,  # Bottom
-            width + 1  # Bottom right
-        ]
-    elif index == width - 1:  # Top right
-        fetchIndex = [
-            width - 2,  # Left
-            2 * width - 1,  # Bottom
-            2 * width - 2  # Bottom left
-        ]
-    elif index == width * (width - 1):  # Bottom left
-        fetchIndex = [
-            width * (width - 2),  # Top
-            width * (width - 1) + 1,  # Right
-            width * (width - 2) + 1  # Top right
-        ]
-    elif index == width ** 2 - 1:  # Bottom right
-        fetchIndex = [
-            width ** 2 - 2,  # Left
-            width ** 2 - width - 1,  # Top
-            width ** 2 - width - 2  # Top left
-        ]
-
-    # Logic for edge cases
-    elif index < width:  # Top edge
-        fetchIndex = [
-            index - 1,  # Left
-            index + 1,  # Right
-            index + width,  # Bottom
-            index + width - 1,  # Bottom left
-            index + width + 1  # Bottom right
-        ]
-    elif index % width == 0:  # Left edge
-        fetchIndex = [
-            index - width,  # Top
-            index - width + 1,  # Top right
-            index + 1,  # Right
-            index + width,  # Bottom
-            index + width + 1  # Bottom right
-        ]
-    elif index % width == width - 1:  # Right edge
-        fetchIndex = [
-            index - width,  # Top
-            index - width - 1,  # Top left
-            index - 1,  # Left
-            index + width,  # Bottom
-            index + width - 1  # Bottom left
-        ]
-    elif index > width * (width - 1):  # Bottom edge
-        fetchIndex = [
-            index - 1,  # Left
-            index + 1,  # Right
-            index - width,  # Top
-            index - width - 1,  # Top left
-            index - width + 1  # Top right
-        ]
-    else:
-        fetchIndex = [
-            index - 1,  # Left
-            index + 1,  # Right
-            index - width,  # Top
-            index + width,  # Bottom
-            index - width - 1,  # Top left
-            index - width + 1,  # Top right
-            index + width - 1,  # Bottom left
-            index + width + 1  # Bottom right
-        ]
+def countAdjacent(
+        cellBinary: Sequence[int],
+        width: int,
+        index: int
+) -> int:
+    """
+    Returns the number of mines adjacent to the cell at index.
 
-    # Throw an error if there are any negative indices
-    if any(i < 0 for i in fetchIndex):
-        raise ValueError("Negative index found")
+    Args:
+        cellBinary (Sequence[int]): The cells, 1/True where a cell contains a mine. Prefer a
+            bytearray or uint8 array over list[bool]: one byte per cell instead of a pointer to a
+            boxed bool keeps the whole board in cache.
+        width (int): The width of the board.
+        index (int): The index of the cell.
 
-    # Throw an error if there are any indices greater than the length of the list
-    if any(i >= len(cellBinary) for i in fetchIndex):
-        raise ValueError("Index out of bounds")
+    Returns:
+        int: The number of mines adjacent to the cell at index.
+    """
+    # These guard against caller bugs, not runtime data, so python -O strips them
+    if __debug__:
+        # Ensure that the index is within the bounds of the list
+        if index < 0 or index >= len(cellBinary):
+            raise ValueError("Index out of bounds")
 
-    # Throw an error if there are any duplicate indices
-    if len(fetchIndex) != len(set(fetchIndex)):
-        raise ValueError("Duplicate indices found")
+        # Ensure that the list forms any kind of rectangle
+        if len(cellBinary) % width != 0:
+            raise ValueError("List does not form a rectangle")
 
-    # Order the list of indices
-    fetchIndex.sort()
+    # Walk the shared Moore offset table, masking out neighbours past the board edge; this replaces
+    # the old nine-branch corner/edge dispatch that rebuilt an index list per call
+    height: int = len(cellBinary) // width
+    row, column = divmod(index, width)
 
-    # Count the number of mines adjacent to the cell
-    for i in fetchIndex:
-        if cellBinary[i]:
+    count: int = 0
+    for rowDelta, columnDelta in _MOORE_OFFSETS:
+        neighbourRow: int = row + rowDelta
+        neighbourColumn: int = column + columnDelta
+        if 0 <= neighbourRow < height and 0 <= neighbourColumn < width and cellBinary[neighbourRow * width + neighbourColumn]:
             count += 1
 
     return count
 
 
-def _verifyKey(
-        key: str,
-        cellCount: int
-) -> str:
-    """
-    Verifies that the key is intact (this is very rare), if not corrects it.
-
-    Args:
-        key (str): The key to verify.
-        cellCount (int): The number of cells in the board.
-
-    Returns:
-        str: The verified key.
-    """
-    # Ensure that the key is the correct length, if not, pad with zeroes
-    if len(key) < cellCount // 4:
-        key = "0" * (cellCount // 4 - len(key)) + key
-
-    return key
-
-
 class Board:
     """
     Represents a board instance. Contains cells.
     """
     # Type hints
     boardKey: str
-    boardBits: str
+    _boardBits: str | None
     width: int
     height: int
-    cells: list[Cell]
     probability: float
 
+    # Structure-of-arrays cell state; Cell objects are built on demand in __getitem__
+    _mines: np.ndarray
+    _adjacent: np.ndarray
+    _adjacentBytes: bytes
+    _revealed: np.ndarray
+    _flagged: np.ndarray
+    _rng: np.random.Generator
+
+    @property
+    def boardBits(self) -> str:
+        """
+        The binary string representation of the board.
+
+        Built lazily from the board key since nothing on the hot construction path needs it.
+
+        Returns:
+            str: The binary string representation of the board.
+        """
+        if self._boardBits is None:
+            self._boardBits = format(int(self.boardKey, 16), f"0{self.width * self.height}b")
+        return self._boardBits
+
     def __init__(
             self,
             probability: float,
             width: int,
             height: int,
-            boardKey: str = None
+            boardKey: str = None,
+            adjacentHex: str = None,
+            seed: int | None = None
     ) -> None:
         """
         Initializes the Board object.
@@ -199,6 +184,11 @@ class Board:
             probability (float): The probability of a cell containing a mine.
             width (int): The width of the board.
             height (int): The height of the board.
+            boardKey (str): The hexadecimal key of an existing board to reload.
+            adjacentHex (str): The hex-encoded adjacency counts from a previous adjacentHex()
+                call. When provided alongside boardKey the adjacency recount is skipped.
+            seed (int | None): Seed for the mine-placement RNG; a seeded board can be replayed
+                deterministically without storing its key.
 
         Returns:
             None
@@ -206,25 +196,94 @@ class Board:
         self.width = width
         self.height = height
         self.probability = probability
+        self._rng = np.random.default_rng(seed)
 
         # If a board key is not provided generate the board
         if boardKey is None:
             self._gen()
             return
 
-        # Convert the hexadecimal key to binary
+        # Decode the hexadecimal key straight to a bit array, skipping the intermediate binary string
         self.boardKey = boardKey
-        self.boardBits = bin(int(boardKey, 16))[2:]
+        self._boardBits = None
+
+        numCells: int = width * height
+        numBytes: int = (numCells + 7) // 8
+        raw: bytes = bytes.fromhex(boardKey.zfill(2 * numBytes))
+
+        # The board occupies the low numCells bits, matching the old zero-left-padded binary string
+        mines: np.ndarray = np.unpackbits(np.frombuffer(raw, dtype=np.uint8))[8 * numBytes - numCells:]
 
-        # Ensure that the board key is the correct length, if not, pad with zeroes
-        if len(self.boardBits) < (width * height):
-            self.boardBits = "0" * ((width * height) - len(self.boardBits)) + self.boardBits
+        # Reuse previously serialized adjacency counts when available, otherwise recount
+        if adjacentHex is not None:
+            adjacent: np.ndarray = np.frombuffer(bytes.fromhex(adjacentHex), dtype=np.uint8)
+        else:
+            adjacent = countAdjacentAll(mines, width, height)
 
-        # Converse to list of boolean values representing whether a cell contains a mine
-        cellBinary: list[bool] = [self.boardBits[i] == "1" for i in range(width * height)]
+        self._initCells(mines, adjacent)
 
-        # Generate the list of cells
-        self.cells = [Cell(self.boardBits[i] == "1", countAdjacent(cellBinary, self.width, i)) for i in range(width * height)]
+    def _initCells(
+            self,
+            mines: np.ndarray,
+            adjacent: np.ndarray
+    ) -> None:
+        """
+        Stores the cell state as parallel arrays.
+
+        Cells are not materialized here; __getitem__ builds Cell views on demand and the cells
+        property materializes the full list only when explicitly asked for.
+
+        Args:
+            mines (np.ndarray): Flat uint8 array of cells, 1 where a cell contains a mine.
+            adjacent (np.ndarray): Flat uint8 array of adjacent mine counts.
+
+        Returns:
+            None
+        """
+        self._mines = mines.astype(bool)
+        self._adjacent = adjacent
+        self._adjacentBytes = np.ascontiguousarray(adjacent, dtype=np.uint8).tobytes()
+        self._revealed = np.zeros(mines.size, dtype=bool)
+        self._flagged = np.zeros(mines.size, dtype=bool)
+
+    def adjacentHex(self) -> str:
+        """
+        Returns the adjacency counts as a hex string.
+
+        The bytes are cached at construction, so serialization is a single hex-encode; feeding
+        the string back into __init__ skips the adjacency recount on reload.
+
+        Returns:
+            str: The hex-encoded adjacency counts, one byte per cell.
+        """
+        return self._adjacentBytes.hex()
+
+    def serialize(self) -> str:
+        """
+        Serializes the board to a single string.
+
+        Returns:
+            str: The board key and adjacency counts, colon-separated.
+        """
+        return f"{self.boardKey}:{self.adjacentHex()}"
+
+    @property
+    def cells(self) -> list[Cell]:
+        """
+        The cells of the board, materialized from the state arrays.
+
+        Returns:
+            list[Cell]: The cells of the board.
+        """
+        return [
+            Cell(mine, count, revealed, flagged)
+            for mine, count, revealed, flagged in zip(
+                self._mines.tolist(),
+                self._adjacent.tolist(),
+                self._revealed.tolist(),
+                self._flagged.tolist()
+            )
+        ]
 
     def _gen(self) -> None:
         """
@@ -236,20 +295,19 @@ class Board:
         # Precalculate the number of cells as it is used multiple times
         numCells: int = self.width * self.height
 
-        # Generate list of boolean values representing whether a cell contains a mine
-        cellBinary: list[bool] = [decision(self.probability) for _ in range(numCells)]
-
-        # Generate list of Cell objects
-        self.cells = [Cell(cellBinary[i], countAdjacent(cellBinary, self.width, i)) for i in range(numCells)]
-
-        # Create binary string representation of the board
-        self.boardBits = "".join("1" if cellBinary[i] else "0" for i in range(numCells))
+        # Sample the whole mine mask in one PCG64 call rather than numCells decision() calls
+        mines: np.ndarray = (self._rng.random(numCells) < self.probability).astype(np.uint8)
 
-        # Convert to hexadecimal
-        self.boardKey = hex(int(self.boardBits, 2))[2:]
+        # Count adjacency for the whole board at once and keep the state as parallel arrays
+        self._initCells(mines, countAdjacentAll(mines, self.width, self.height))
 
-        # Verify that the key is intact
-        self.boardKey = _verifyKey(self.boardKey, numCells)
+        # Pack the mask to bytes and hex-encode in C, low-aligned to match the decode path; the
+        # binary string is only built lazily if something reads boardBits
+        numBytes: int = (numCells + 7) // 8
+        padded: np.ndarray = np.zeros(8 * numBytes, dtype=np.uint8)
+        padded[8 * numBytes - numCells:] = mines
+        self.boardKey = np.packbits(padded).tobytes().hex()
+        self._boardBits = None
 
     """
 ================================================================================================================================================================
@@ -270,7 +328,12 @@ class Board:
         Returns:
             Cell: The cell at index.
         """
-        return self.cells[index]
+        return Cell(
+            bool(self._mines[index]),
+            int(self._adjacent[index]),
+            bool(self._revealed[index]),
+            bool(self._flagged[index])
+        )
 
     def __str__(self) -> str:
         """
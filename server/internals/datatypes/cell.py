@@ -7,6 +7,9 @@ class Cell:
     """
     Represents a singular cell in the game board.
     """
+    # Slots instead of a per-instance __dict__; boards materialize width*height of these
+    __slots__ = ("mine", "adjacentMines", "revealed", "flagged")
+
     # Type hints
     mine: bool
     adjacentMines: int
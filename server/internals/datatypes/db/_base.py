@@ -3,13 +3,13 @@ Base class for all data types.
 """
 
 # Standard Library Imports
-from typing import Any
+from typing import Any, Iterator
 from datetime import datetime
 
 # Third Party Imports
 from pydantic import BaseModel as PydanticBaseModel
 from psycopg2.extensions import connection as Connection
-from psycopg2.extras import RealDictRow, RealDictCursor
+from psycopg2.extras import RealDictRow, RealDictCursor, execute_values
 from psycopg2.sql import SQL, Identifier
 
 
@@ -25,6 +25,10 @@ class DbBase:
     """
     Base class for all data types.
     """
+    # Slots here so subclasses that declare their own __slots__ actually drop the per-instance
+    # __dict__; subclasses without __slots__ still get one automatically
+    __slots__ = ("id", "createdAt", "_connection", "_tableName", "__weakref__")
+
     # Type hints
     id: int
     createdAt: datetime
@@ -72,7 +76,9 @@ class DbBase:
         Returns:
             dict: The data type as a dictionary.
         """
-        return self.__dict__
+        # id and createdAt live in slots, so __dict__ alone would drop them for subclasses that
+        # rely on this default (their own fields still come through the instance dict)
+        return {"id": self.id, "createdAt": self.createdAt, **self.__dict__}
 
     """
 ================================================================================================================================================================
@@ -104,27 +110,65 @@ class DbBase:
                 (value, self.id)
             )
 
+    def _setMany(
+            self,
+            **columns: Any
+    ) -> None:
+        """
+        Sets multiple columns in the database with a single UPDATE.
+
+        Callers that change several fields at once should prefer this over repeated _set calls,
+        which cost one round trip each.
+
+        Args:
+            **columns: Column names mapped to the values to set.
+
+        Returns:
+            None
+        """
+        if not columns:
+            return
+
+        with self._connection.cursor() as cursor:
+            cursor.execute(
+                SQL("UPDATE {tableName} SET {assignments} WHERE id = %s").format(
+                    tableName=Identifier(self._tableName),
+                    assignments=SQL(", ").join(
+                        SQL("{column} = %s").format(column=Identifier(column)) for column in columns
+                    )
+                ),
+                (*columns.values(), self.id)
+            )
+
     def _getAssoc(
             self,
             target: str,
             columns: tuple[str] = ("*",)
-    ) -> list[RealDictRow]:
+    ) -> Iterator[RealDictRow]:
         """
         Gets related data from the database.
 
         Performs a join on the relation table to get the related data from the target table based on the ID of the data type.
+        Uses a named server-side cursor so rows are streamed in batches rather than materialized all at once.
 
         Args:
             target (str): The name of the target table.
             columns (list[str]): The columns to get.
+
+        Yields:
+            RealDictRow: The related rows, one at a time.
         """
-        with self._connection.cursor(cursor_factory=RealDictCursor) as cursor:
+        with self._connection.cursor(
+                name=f"{self._tableName}_{target}_assoc",
+                cursor_factory=RealDictCursor
+        ) as cursor:
+            cursor.itersize = 200
             cursor.execute(
                 SQL("""
                 SELECT {columns}
-                FROM {target} 
-                JOIN {relationTable} 
-                ON {target}.id = {relationTable}.{target}_id 
+                FROM {target}
+                JOIN {relationTable}
+                ON {target}.id = {relationTable}.{target}_id
                 WHERE {relationTable}.{_tableName}_id = %s
                 """).format(
                     columns=SQL(", ").join(map(Identifier, columns)),
@@ -134,7 +178,7 @@ class DbBase:
                 ),
                 (self.id,)
             )
-            return cursor.fetchall()
+            yield from cursor
 
     def _deleteAssoc(
             self,
@@ -183,3 +227,35 @@ class DbBase:
                 (self.id, targetId)
             )
 
+    def _addAssocMany(
+            self,
+            target: str,
+            targetIds: list[int]
+    ) -> None:
+        """
+        Adds multiple related data rows to the database in one round trip.
+
+        Uses execute_values so a batch of associations costs a single statement instead of one
+        INSERT per ID.
+
+        Args:
+            target (str): The name of the target table.
+            targetIds (list[int]): The IDs of the target data types.
+
+        Returns:
+            None
+        """
+        if not targetIds:
+            return
+
+        with self._connection.cursor() as cursor:
+            execute_values(
+                cursor,
+                SQL("INSERT INTO {relationTable} ({_tableName}_id, {target}_id) VALUES %s").format(
+                    relationTable=Identifier(f"{self._tableName}_{target}"),
+                    _tableName=Identifier(self._tableName),
+                    target=Identifier(target)
+                ),
+                [(self.id, targetId) for targetId in targetIds]
+            )
+
@@ -29,14 +29,53 @@ class Game(DbBase):
     Represents a game in the database.
     """
     # Type Hints
-    _key: str
-    _width: int
-    _height: int
-    _time: int | None  # Time in MS
+    _row: dict  # Single row dict backing the data properties
 
     # Non-data properties
     _config: Config
     _connection: Connection
+    _usersCache: list[User] | None
+
+    # Column order used by the tuple-cursor lookups in Database
+    _rowColumns: tuple[str, ...] = (
+        "id",
+        "created_at",
+        "board_key",
+        "board_width",
+        "board_height",
+        "time"
+    )
+
+    @classmethod
+    def fromRow(
+            cls,
+            row: tuple,
+            connection: Connection,
+            config: Config
+    ) -> "Game":
+        """
+        Builds a Game from a positional row tuple.
+
+        Avoids the per-row dict that RealDictCursor builds; the row must match the column order in
+        _rowColumns.
+
+        Args:
+            row (tuple): The row from the database, in _rowColumns order.
+            connection (Connection): The connection to use for database operations.
+            config (Config): The configuration object.
+
+        Returns:
+            Game: The game object.
+        """
+        game: "Game" = cls.__new__(cls)
+        game._connection = connection
+        game._config = config
+        DbBase.__init__(game, "games", connection, row[0], row[1])
+
+        game._row = dict(zip(cls._rowColumns, row))
+        game._usersCache = None
+
+        return game
 
     def __init__(
             self,
@@ -60,11 +99,11 @@ class Game(DbBase):
         createdAt: str = row['created_at']
         super().__init__("games", connection, gameId, createdAt)
 
-        # Set all other data
-        self._key = row['board_key']
-        self._width = row['board_width']
-        self._height = row['board_height']
-        self._time = row['time']
+        # Keep the row dict itself; the properties index it directly
+        self._row = dict(row)
+
+        # Lazily populated cache for the users property
+        self._usersCache = None
 
     """
 ================================================================================================================================================================
@@ -86,7 +125,7 @@ class Game(DbBase):
         Returns:
             str: The key of the game.
         """
-        return self._key
+        return self._row["board_key"]
 
     @property
     def width(self) -> int:
@@ -96,7 +135,7 @@ class Game(DbBase):
         Returns:
             int: The width of the game.
         """
-        return self._width
+        return self._row["board_width"]
 
     @property
     def height(self) -> int:
@@ -106,7 +145,7 @@ class Game(DbBase):
         Returns:
             int: The height of the game.
         """
-        return self._height
+        return self._row["board_height"]
 
     @property
     def time(self) -> int | None:
@@ -116,7 +155,7 @@ class Game(DbBase):
         Returns:
             int | None: The time of the game.
         """
-        return self._time
+        return self._row["time"]
 
     @time.setter
     def time(
@@ -133,7 +172,7 @@ class Game(DbBase):
             None
         """
         self._set("time", time)
-        self._time = time
+        self._row["time"] = time
 
     @property
     def users(self) -> list[User]:
@@ -143,7 +182,10 @@ class Game(DbBase):
         Returns:
             list[User]: The users in the game.
         """
-        return [User(row, self._connection, self._config) for row in self._getAssoc("users")]
+        # Cache the list so repeated property reads skip the association query
+        if self._usersCache is None:
+            self._usersCache = [User(row, self._connection, self._config) for row in self._getAssoc("users")]
+        return self._usersCache
 
     # Allow someone to add a user to the game
     @users.setter  # IDK if this will work or not
@@ -161,6 +203,7 @@ class Game(DbBase):
             None
         """
         self._addAssoc("users", user.id)
+        self._usersCache = None  # The cached list is stale now
 
     """
 ================================================================================================================================================================
@@ -175,11 +218,12 @@ class Game(DbBase):
         Returns:
             GameModel: The game model.
         """
+        row: dict = self._row
         return GameModel(
             id=self.id,
             createdAt=self.createdAt,
-            key=self.key,
-            width=self.width,
-            height=self.height,
-            time=self.time
+            key=row["board_key"],
+            width=row["board_width"],
+            height=row["board_height"],
+            time=row["time"]
         )
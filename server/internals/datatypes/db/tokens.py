@@ -1,12 +1,15 @@
 """
-Custom implementation of the built-in list data type.
+Collection of a user's access tokens.
 """
 
 # Standard Library Imports
 from datetime import datetime, timedelta
-from typing import Iterator
+from time import monotonic
+from typing import Iterator, TYPE_CHECKING
+from weakref import ref
 
 # Third Party Imports
+from psycopg2 import errors
 from psycopg2.extensions import connection as Connection
 from psycopg2.extras import RealDictRow, RealDictCursor
 
@@ -15,6 +18,78 @@ from .token import Token, TokenModel
 from ._base import BaseModel
 from ..._common import _makeAccessToken
 
+if TYPE_CHECKING:
+    from .user import User
+
+
+# Server-side prepared statements for the hot token mutations; prepared lazily once per
+# connection so repeat calls skip parse and plan time
+_PREPARED: dict[str, str] = {
+    "tokens_cleanup": "PREPARE tokens_cleanup (int[]) AS DELETE FROM tokens WHERE id = ANY($1)",
+    "tokens_insert": (
+        "PREPARE tokens_insert (int, text, timestamp) AS "
+        "INSERT INTO tokens (user_id, token, expires_at) VALUES ($1, $2, $3) RETURNING id, created_at"
+    )
+}
+
+# Connections the statements have been prepared on, tracked by id() since psycopg2 connections
+# do not allow attribute assignment
+_preparedConnections: set[int] = set()
+
+
+def _prepare(connection: Connection) -> None:
+    """
+    Prepares the token statements on the connection if not already done.
+
+    Args:
+        connection (Connection): The connection to prepare the statements on.
+
+    Returns:
+        None
+    """
+    if id(connection) in _preparedConnections:
+        return
+
+    with connection.cursor() as cursor:
+        for statement in _PREPARED.values():
+            cursor.execute(statement)
+
+    _preparedConnections.add(id(connection))
+
+
+def _executePrepared(
+        connection: Connection,
+        statement: str,
+        args: tuple
+) -> RealDictRow | None:
+    """
+    Executes a prepared token statement, re-preparing if the server no longer knows it.
+
+    The _preparedConnections set is only a fast path: a rollback on the shared connection
+    deallocates statements prepared inside that transaction, and id() values can be reused after
+    a connection is garbage collected. Either way the server raises InvalidSqlStatementName, so
+    we roll back the aborted transaction, re-prepare and retry once.
+
+    Args:
+        connection (Connection): The connection to execute on.
+        statement (str): The EXECUTE statement.
+        args (tuple): The arguments for the statement.
+
+    Returns:
+        RealDictRow | None: The first result row, if the statement produced one.
+    """
+    try:
+        with connection.cursor(cursor_factory=RealDictCursor) as cursor:
+            cursor.execute(statement, args)
+            return cursor.fetchone() if cursor.description is not None else None
+    except errors.InvalidSqlStatementName:
+        connection.rollback()
+        _preparedConnections.discard(id(connection))
+        _prepare(connection)
+        with connection.cursor(cursor_factory=RealDictCursor) as cursor:
+            cursor.execute(statement, args)
+            return cursor.fetchone() if cursor.description is not None else None
+
 
 class TokensModel(BaseModel):
     """
@@ -23,32 +98,54 @@ class TokensModel(BaseModel):
     tokens: list[TokenModel]
 
 
-class Tokens(list):
+class Tokens:
     """
-    Custom implementation of the built-in list data type to store tokens.
+    Collection of a user's access tokens, indexed by token string.
+
+    Holds the tokens in a plain list plus a dict keyed on the token string, so membership checks
+    and lookups are O(1) and refreshes are a single pass. Composition is used instead of
+    inheriting list so no inherited mutator can bypass the database sync.
     """
+    # Fixed attribute set; avoids a per-instance __dict__ for every user's token collection
+    __slots__ = (
+        "_items",
+        "_byToken",
+        "_connection",
+        "_expirationTime",
+        "_jwtSecret",
+        "_userId",
+        "_email",
+        "_refreshing",
+        "_lastRefresh",
+        "_user"
+    )
+
     # Type hints
-    _connection: Connection
-    _expirationTime: timedelta
-    _userId: int
-    _email: str
+    _items: list[Token]
+    _byToken: dict[str, Token]
 
     # Non-data properties
     _connection: Connection
-    _expirationTime: timedelta
+    _expirationTime: timedelta | int
     _jwtSecret: str
     _userId: int
     _email: str
-    _refreshing: bool = False
+    _refreshing: bool
+    _lastRefresh: float
+    _user: "ref[User] | None"
+
+    # How long a refresh stays valid; repeated reads within the window skip the DB round trip
+    _refreshTtl: float = 1.0
 
     def __init__(
             self,
             rows: list[RealDictRow],
             connection: Connection,
-            expirationTime: timedelta,
+            expirationTime: timedelta | int,
             jwtSecret: str,
             userId: int,
-            email: str
+            email: str,
+            user: "User" = None
     ) -> None:
         """
         Initializes the Tokens object.
@@ -56,25 +153,64 @@ class Tokens(list):
         Args:
             rows (list[RealDictRow]): The rows from the database.
             connection (Connection): The connection to use for database operations.
-            expirationTime (timedelta): The time until the token expires.
+            expirationTime (timedelta | int): The time until the token expires, as a timedelta or a
+                precomputed number of seconds.
             jwtSecret (str): The secret to use for the JWT.
             userId (int): The ID of the user.
             email (str): The email of the user.
+            user (User): The owning user, held weakly; mutations push-refresh its token cache.
 
         Returns:
             None
         """
-        super().__init__()
-
         # Set the connection
         self._connection = connection
         self._expirationTime = expirationTime
         self._jwtSecret = jwtSecret
         self._userId = userId
         self._email = email
+        self._refreshing = False
+        self._user = ref(user) if user is not None else None
+
+        # Build the list and the by-token index in one pass
+        self._items = [Token(row, connection) for row in rows]
+        self._byToken = {token.token: token for token in self._items}
+
+        # The rows were just fetched, so the first TTL window starts now
+        self._lastRefresh = monotonic()
+
+    def append(
+            self,
+            token: Token
+    ) -> None:
+        """
+        Appends a token, keeping the by-token index in sync.
+
+        Args:
+            token (Token): The token to append.
+
+        Returns:
+            None
+        """
+        self._items.append(token)
+        self._byToken[token.token] = token
+
+    def _touchUserCache(self) -> None:
+        """
+        Push-refreshes the owning user's token cache after a mutation.
 
-        for row in rows:
-            self.append(Token(row, connection))
+        This object is the cached value, so the mutation is already visible; bumping the
+        timestamp keeps the cache warm instead of forcing a reload on the next read.
+
+        Returns:
+            None
+        """
+        if self._user is None:
+            return
+
+        user: "User | None" = self._user()
+        if user is not None:
+            user._accessTokensCache = (monotonic(), self)
 
     def dict(self) -> list[dict]:
         """
@@ -85,12 +221,23 @@ class Tokens(list):
         """
         # Refresh the tokens before returning them
         self._refresh()
-        return [token.dict() for token in self]
+        return [token.dict() for token in self._items]
 
-    def _refresh(self) -> None:
+    def _refresh(
+            self,
+            force: bool = False
+    ) -> None:
         """
         Refreshes all the tokens in the list to ensure that they are valid both in the database and in memory.
 
+        Refreshes are TTL-gated: repeated calls within the window return immediately so a burst of
+        reads costs at most one DELETE round trip instead of one per access. The DELETE is not
+        committed here; the request middleware commits at the request boundary, and flush() exists
+        for callers that need immediate durability.
+
+        Args:
+            force (bool): Refresh even if the TTL window has not elapsed.
+
         Returns:
             None
         """
@@ -98,32 +245,70 @@ class Tokens(list):
         if self._refreshing:
             return
 
+        # Skip the round trip entirely if the last refresh is still fresh
+        now: float = monotonic()
+        if not force and now - self._lastRefresh < self._refreshTtl:
+            return
+        self._lastRefresh = now
+
         # Set the refreshing flag to True to prevent infinite recursion
         self._refreshing = True
 
         # Get the current time
         currentTime: datetime = datetime.now()
 
-        # Refresh all the tokens in the list
-        for token in self:
-            if token.expiration < currentTime:
-                self.pop(self.index(token))  # Remove the token from the list
-
-        # Remove old tokens from the database
-        with self._connection.cursor(cursor_factory=RealDictCursor) as cursor:
-            cursor.execute(
-                """
-                DELETE FROM tokens
-                WHERE user_id = %s
-                AND expires_at < %s
-                """,
-                (self._userId, currentTime)
-            )
-            self._connection.commit()
+        # Single filter pass over the in-memory tokens, collecting the expired row IDs as we go
+        keep: list[Token] = []
+        expiredIds: list[int] = []
+        for token in self._items:
+            if token.expiration >= currentTime:
+                keep.append(token)
+            else:
+                expiredIds.append(token.id)
+
+        # Nothing expired, so the database rows are still valid too; skip the DELETE round trip
+        if not expiredIds:
+            self._refreshing = False
+            return
+
+        # Rebuild the list and the index from the surviving tokens
+        self._items = keep
+        self._byToken = {token.token: token for token in keep}
+
+        # Delete exactly the expired rows by primary key rather than range-scanning expires_at
+        _prepare(self._connection)
+        _executePrepared(self._connection, "EXECUTE tokens_cleanup(%s)", (expiredIds,))
+
+        # The deletions are reflected here already; keep the owner's cache warm
+        self._touchUserCache()
 
         # Set the refreshing flag to False
         self._refreshing = False
 
+    def flush(self) -> None:
+        """
+        Commits any pending token mutations immediately.
+
+        Token operations normally ride in the caller-managed request transaction; use this when a
+        write must be durable before the request completes.
+
+        Returns:
+            None
+        """
+        self._connection.commit()
+
+    def refresh(self) -> None:
+        """
+        Forces a refresh of the tokens.
+
+        The read dunders never refresh; callers that need up-to-date expiry state use this, dict(),
+        toModel() or new() as the explicit boundaries.
+
+        Returns:
+            None
+        """
+        self._refresh(force=True)
+
     def new(self) -> Token:
         """
         Creates a new token and appends it to the list.
@@ -131,8 +316,9 @@ class Tokens(list):
         Returns:
             Token: The new token.
         """
-        # Refresh the tokens before creating a new one
-        self._refresh()
+        # Refresh the tokens before creating a new one; creation always gets a real refresh, and
+        # the expiry DELETE and the INSERT land in the same request transaction
+        self._refresh(force=True)
 
         # Create the new token
         accessToken, expires = _makeAccessToken(
@@ -143,24 +329,31 @@ class Tokens(list):
             self._jwtSecret
         )
 
-        # Add the token to the database
-        with self._connection.cursor(cursor_factory=RealDictCursor) as cursor:
-            cursor.execute(
-                """
-                INSERT INTO tokens (user_id, token, expires_at)
-                VALUES (%s, %s, %s)
-                RETURNING *
-                """,
-                (self._userId, accessToken, expires)
-            )
-            row: RealDictRow = cursor.fetchone()
-            self._connection.commit()
-
-        # Create the token object
-        token: Token = Token(row, self._connection)
-
-        # Append the token to the list
+        # Add the token to the database, returning only the server-generated columns; the rest of
+        # the row is already known client-side
+        _prepare(self._connection)
+        generated: RealDictRow = _executePrepared(
+            self._connection,
+            "EXECUTE tokens_insert(%s, %s, %s)",
+            (self._userId, accessToken, expires)
+        )
+
+        # Create the token object from the local values plus the generated id and timestamp
+        token: Token = Token(
+            {
+                "id": generated["id"],
+                "created_at": generated["created_at"],
+                "user_id": self._userId,
+                "token": accessToken,
+                "expires_at": expires
+            },
+            self._connection
+        )
+
+        # Append the token to the list and push-refresh the owner's cache so the new token is
+        # immediately visible without waiting out the TTL
         self.append(token)
+        self._touchUserCache()
 
         return token
 
@@ -174,7 +367,7 @@ class Tokens(list):
         # Refresh the tokens before converting them
         self._refresh()
         return TokensModel(
-            tokens=[token.toModel() for token in self]
+            tokens=[token.toModel() for token in self._items]
         )
 
     """
@@ -193,20 +386,16 @@ class Tokens(list):
         Returns:
             Token: The token at the given index.
         """
-        # Refresh the tokens before returning them
-        self._refresh()
-        return super().__getitem__(key)
+        return self._items[key]
 
-    def __iter__(self) -> Iterator:
+    def __iter__(self) -> Iterator[Token]:
         """
         Returns the iterator for the tokens.
 
         Returns:
-            Tokens: The iterator for the tokens.
+            Iterator[Token]: The iterator for the tokens.
         """
-        # Refresh the tokens before returning them
-        self._refresh()
-        return super().__iter__()
+        return iter(self._items)
 
     def __len__(self) -> int:
         """
@@ -215,23 +404,19 @@ class Tokens(list):
         Returns:
             int: The number of tokens in the list.
         """
-        # Refresh the tokens before returning them
-        self._refresh()
-        return super().__len__()
+        return len(self._items)
 
-    def __contains__(self, token: Token) -> bool:
+    def __contains__(self, token: Token | str) -> bool:
         """
         Checks if the list contains the given token.
 
         Args:
-            token (Token): The token to check for.
+            token (Token | str): The token, or token string, to check for.
 
         Returns:
             bool: True if the token is in the list, False otherwise.
         """
-        # Refresh the tokens before checking for the token
-        self._refresh()
-        return super().__contains__(token)
+        return (token if isinstance(token, str) else token.token) in self._byToken
 
     def __str__(self) -> str:
         """
@@ -240,9 +425,7 @@ class Tokens(list):
         Returns:
             str: The string representation of the tokens.
         """
-        # Refresh the tokens before returning them
-        self._refresh()
-        return super().__str__()
+        return str(self._items)
 
     def __repr__(self) -> str:
         """
@@ -251,160 +434,28 @@ class Tokens(list):
         Returns:
             str: The string representation of the tokens.
         """
-        # Refresh the tokens before returning them
-        self._refresh()
-        return super().__repr__()
+        return self.__str__()
 
-    def __eq__(self, other: list[Token]) -> bool:
+    def __eq__(self, other: "Tokens | list[Token]") -> bool:
         """
         Checks if the list of tokens is equal to the other list of tokens.
 
         Args:
-            other (list[Token]): The other list of tokens.
+            other (Tokens | list[Token]): The other list of tokens.
 
         Returns:
             bool: True if the lists are equal, False otherwise.
         """
-        # Refresh the tokens before checking for equality
-        self._refresh()
-        return super().__eq__(other)
+        return self._items == (other._items if isinstance(other, Tokens) else other)
 
-    def __ne__(self, other: list[Token]) -> bool:
+    def __ne__(self, other: "Tokens | list[Token]") -> bool:
         """
         Checks if the list of tokens is not equal to the other list of tokens.
 
         Args:
-            other (list[Token]): The other list of tokens.
+            other (Tokens | list[Token]): The other list of tokens.
 
         Returns:
             bool: True if the lists are not equal, False otherwise.
         """
-        # Refresh the tokens before checking for inequality
-        self._refresh()
-        return super().__ne__(other)
-
-    def __lt__(self, other: list[Token]) -> bool:
-        """
-        Checks if the list of tokens is less than the other list of tokens.
-
-        Args:
-            other (list[Token]): The other list of tokens.
-
-        Returns:
-            bool: True if the list is less than the other list, False otherwise.
-        """
-        # Refresh the tokens before checking for less than
-        self._refresh()
-        return super().__lt__(other)
-
-    def __le__(self, other: list[Token]) -> bool:
-        """
-        Checks if the list of tokens is less than or equal to the other list of tokens.
-
-        Args:
-            other (list[Token]): The other list of tokens.
-
-        Returns:
-            bool: True if the list is less than or equal to the other list, False otherwise.
-        """
-        # Refresh the tokens before checking for less than or equal to
-        self._refresh()
-        return super().__le__(other)
-
-    def __gt__(self, other: list[Token]) -> bool:
-        """
-        Checks if the list of tokens is greater than the other list of tokens.
-
-        Args:
-            other (list[Token]): The other list of tokens.
-
-        Returns:
-            bool: True if the list is greater than the other list, False otherwise.
-        """
-        # Refresh the tokens before checking for greater than
-        self._refresh()
-        return super().__gt__(other)
-
-    def __ge__(self, other: list[Token]) -> bool:
-        """
-        Checks if the list of tokens is greater than or equal to the other list of tokens.
-
-        Args:
-            other (list[Token]): The other list of tokens.
-
-        Returns:
-            bool: True if the list is greater than or equal to the other list, False otherwise.
-        """
-        # Refresh the tokens before checking for greater than or equal to
-        self._refresh()
-        return super().__ge__(other)
-
-    def __add__(self, other: list[Token]) -> list[Token]:
-        """
-        Adds the other list of tokens to the list of tokens.
-
-        Args:
-            other (list[Token]): The other list of tokens.
-
-        Returns:
-            list[Token]: The combined list of tokens.
-        """
-        # Refresh the tokens before adding the other list
-        self._refresh()
-        return super().__add__(other)
-
-    def __iadd__(self, other: list[Token]) -> list[Token]:
-        """
-        Adds the other list of tokens to the list of tokens in place.
-
-        Args:
-            other (list[Token]): The other list of tokens.
-
-        Returns:
-            list[Token]: The combined list of tokens.
-        """
-        # Refresh the tokens before adding the other list
-        self._refresh()
-        return super().__iadd__(other)
-
-    def __mul__(self, n: int) -> list[Token]:
-        """
-        Multiplies the list of tokens by the given number.
-
-        Args:
-            n (int): The number to multiply the list by.
-
-        Returns:
-            list[Token]: The multiplied list of tokens.
-        """
-        # Refresh the tokens before multiplying the list
-        self._refresh()
-        return super().__mul__(n)
-
-    def __imul__(self, n: int) -> list[Token]:
-        """
-        Multiplies the list of tokens by the given number in place.
-
-        Args:
-            n (int): The number to multiply the list by.
-
-        Returns:
-            list[Token]: The multiplied list of tokens.
-        """
-        # Refresh the tokens before multiplying the list
-        self._refresh()
-        return super().__imul__(n)
-
-    def __rmul__(self, n: int) -> list[Token]:
-        """
-        Multiplies the list of tokens by the given number.
-
-        Args:
-            n (int): The number to multiply the list by.
-
-        Returns:
-            list[Token]: The multiplied list of tokens.
-        """
-        # Refresh the tokens before multiplying the list
-        self._refresh()
-        return super().__rmul__(n)
+        return not self.__eq__(other)
@@ -2,18 +2,126 @@
 Contains the user class.
 """
 # Standard Library Imports
+from base64 import b64decode
+from functools import lru_cache
+from hashlib import pbkdf2_hmac, sha256
+from hmac import compare_digest
+from threading import Lock
+from time import monotonic
+from typing import Callable
 
 # Third Party Imports
-from passlib.context import CryptContext
 from psycopg2.extensions import connection as Connection
 from psycopg2.extras import RealDictRow, RealDictCursor
 
+# fastpbkdf2 caches the HMAC ipad/opad states and vectorizes the block derivation, roughly
+# halving the hash operations per verify; fall back to hashlib's OpenSSL path when absent
+try:
+    from fastpbkdf2 import pbkdf2_hmac as _fastPbkdf2Hmac
+except ImportError:
+    _fastPbkdf2Hmac = None
+
 # Local Imports
 from ._base import DbBase, BaseModel
 from .tokens import Tokens
 from ...config import Config
 
 
+def _ab64Decode(data: str) -> bytes:
+    """
+    Decodes passlib's adapted base64 back to bytes.
+
+    Args:
+        data (str): The encoded string.
+
+    Returns:
+        bytes: The decoded bytes.
+    """
+    data = data.replace(".", "+")
+    return b64decode(data + "=" * (-len(data) % 4))
+
+
+def _verifyPbkdf2(
+        password: str,
+        stored: str
+) -> bool:
+    """
+    Verifies a password against a $pbkdf2-sha512$ hash using the OpenSSL C path.
+
+    Args:
+        password (str): The password to verify.
+        stored (str): The stored hash string.
+
+    Returns:
+        bool: True if the password matches, False otherwise.
+    """
+    _, _, rounds, salt, checksum = stored.split("$")
+    expected: bytes = _ab64Decode(checksum)
+    kdf = _fastPbkdf2Hmac if _fastPbkdf2Hmac is not None else pbkdf2_hmac
+    digest: bytes = kdf("sha512", password.encode("utf-8"), _ab64Decode(salt), int(rounds), len(expected))
+    return compare_digest(digest, expected)
+
+
+@lru_cache(maxsize=4)
+def _argon2Hasher(
+        timeCost: int,
+        memoryCost: int,
+        parallelism: int
+) -> "PasswordHasher":
+    """
+    Builds the argon2id hasher on first use.
+
+    argon2-cffi is imported lazily like passlib so workers that never hash a password skip the
+    import entirely.
+
+    Args:
+        timeCost (int): The number of argon2 iterations.
+        memoryCost (int): The argon2 memory cost in KiB.
+        parallelism (int): The number of argon2 lanes.
+
+    Returns:
+        PasswordHasher: The argon2id hasher.
+    """
+    from argon2 import PasswordHasher
+
+    return PasswordHasher(time_cost=timeCost, memory_cost=memoryCost, parallelism=parallelism)
+
+
+@lru_cache(maxsize=1)
+def _pwContext() -> "CryptContext":
+    """
+    Builds the password hashing context on first use.
+
+    passlib is imported lazily so workers that never verify a password skip both the import and
+    the CryptContext construction at module load.
+
+    Returns:
+        CryptContext: The password hashing context.
+    """
+    from passlib.context import CryptContext
+
+    # bcrypt stays listed so rows hashed before the argon2id switch still verify
+    return CryptContext(schemes=["pbkdf2_sha512", "bcrypt"], deprecated="auto")
+
+
+# Hooks fired (with the user's uuid) when a user's credentials or access change; higher layers
+# register callbacks here to evict their own caches, keeping this module free of app imports
+_credentialChangeHooks: list[Callable[[str], None]] = []
+
+
+def onCredentialChange(hook: Callable[[str], None]) -> None:
+    """
+    Registers a hook to run whenever a user's password, access level or ban state changes.
+
+    Args:
+        hook (Callable[[str], None]): Called with the uuid of the changed user.
+
+    Returns:
+        None
+    """
+    _credentialChangeHooks.append(hook)
+
+
 class UserModel(BaseModel):
     """
     Model for the user.
@@ -30,6 +138,21 @@ class User(DbBase):
     """
     Application user.
     """
+    # Fixed attribute set; combined with the DbBase slots this drops the per-instance __dict__
+    __slots__ = (
+        "_config",
+        "_uuid",
+        "_email",
+        "_password",
+        "_username",
+        "_accessLevel",
+        "_refreshToken",
+        "_oauthScopes",
+        "_accessTokensCache",
+        "_dictCache",
+        "_modelCache"
+    )
+
     # Type hints
     _uuid: str
     _email: str
@@ -38,9 +161,73 @@ class User(DbBase):
     _accessLevel: int
     _refreshToken: str
     _oauthScopes: list[str]
+    _accessTokensCache: tuple[float, Tokens] | None
+    _dictCache: dict | None
+    _modelCache: UserModel | None
+
+    # How long a fetched Tokens object is served from the instance cache. Mutations through
+    # Tokens push-refresh this cache, so the window can be generous.
+    _accessTokensTtl: float = 60.0
+
+    # Class-level cache of successful verifications, keyed on (uuid, sha256(password), stored
+    # hash) with a monotonic deadline. Only successes are cached; the stored hash in the key means
+    # a password change invalidates old entries automatically.
+    _verifyCache: dict[tuple[str, bytes, str], float] = {}
+    _verifyCacheLock: Lock = Lock()
+    _verifyCacheTtl: float = 60.0
+    _verifyCacheMax: int = 10_000
+
+    # Column order used by the tuple-cursor lookups in Database
+    _rowColumns: tuple[str, ...] = (
+        "id",
+        "created_at",
+        "uuid",
+        "email",
+        "password",
+        "username",
+        "access_level",
+        "refresh_token",
+        "oauth_scopes"
+    )
+
+    @classmethod
+    def fromRow(
+            cls,
+            row: tuple,
+            connection: Connection,
+            config: Config
+    ) -> "User":
+        """
+        Builds a User from a positional row tuple.
 
-    # Password hashing context
-    _context: CryptContext = CryptContext(schemes=["pbkdf2_sha512"], deprecated="auto")
+        Avoids the per-row dict that RealDictCursor builds; the row must match the column order in
+        _rowColumns.
+
+        Args:
+            row (tuple): The row from the database, in _rowColumns order.
+            connection (Connection): The connection to use for database operations.
+            config (Config): The configuration object.
+
+        Returns:
+            User: The user object.
+        """
+        user: "User" = cls.__new__(cls)
+        user._connection = connection
+        user._config = config
+        DbBase.__init__(user, "users", connection, row[0], row[1])
+
+        user._uuid = row[2]
+        user._email = row[3]
+        user._password = row[4]
+        user._username = row[5]
+        user._accessLevel = row[6]
+        user._refreshToken = row[7]
+        user._oauthScopes = row[8]
+        user._accessTokensCache = None
+        user._dictCache = None
+        user._modelCache = None
+
+        return user
 
     def __init__(
             self,
@@ -75,12 +262,37 @@ class User(DbBase):
         self._refreshToken: str = row["refresh_token"]
         self._oauthScopes: list[str] = row["oauth_scopes"]
 
+        # Lazily populated caches for the accessTokens property and the serialized forms
+        self._accessTokensCache = None
+        self._dictCache = None
+        self._modelCache = None
+
     """
 ================================================================================================================================================================
         Properties
 ================================================================================================================================================================
     """
 
+    def _invalidateSerialized(self) -> None:
+        """
+        Drops the cached dict() and toModel() output after a field change.
+
+        Returns:
+            None
+        """
+        self._dictCache = None
+        self._modelCache = None
+
+    def _fireCredentialChange(self) -> None:
+        """
+        Notifies registered hooks that this user's credentials or access changed.
+
+        Returns:
+            None
+        """
+        for hook in _credentialChangeHooks:
+            hook(self._uuid)
+
     @property
     def uuid(self) -> str:
         """
@@ -117,6 +329,7 @@ class User(DbBase):
         """
         self._set("email", email)
         self._email = email
+        self._invalidateSerialized()
 
     @property
     def username(self) -> str:
@@ -144,6 +357,7 @@ class User(DbBase):
         """
         self._set("username", username)
         self._username = username
+        self._invalidateSerialized()
 
     @property
     def password(self) -> str:
@@ -169,16 +383,20 @@ class User(DbBase):
         Returns:
             None
         """
-        # Hash the password
-        hashed = self._context.hash(password)
-
-        # Remove the old password from memory
-        del password
+        # Hash the password with argon2id, the memory-hard PHC winner
+        hashed = self._hasher().hash(password)
 
         # Set the new password
         self._set("password", hashed)
         self._password = hashed
 
+        # Drop any cached verifications for this user
+        with self._verifyCacheLock:
+            for key in [key for key in self._verifyCache if key[0] == self._uuid]:
+                del self._verifyCache[key]
+
+        self._fireCredentialChange()
+
     @property
     def accessLevel(self) -> int:
         """
@@ -205,6 +423,8 @@ class User(DbBase):
         """
         self._set("access_level", accessLevel)
         self._accessLevel = accessLevel
+        self._invalidateSerialized()
+        self._fireCredentialChange()
 
     @property
     def banned(self) -> bool:
@@ -232,6 +452,8 @@ class User(DbBase):
         """
         self._set("access_level", -1 if banned else 0)
         self._accessLevel = -1 if banned else 0
+        self._invalidateSerialized()
+        self._fireCredentialChange()
 
     @property
     def refreshToken(self) -> str:  # Do not define a setter for this property, as it must not be changed
@@ -251,6 +473,11 @@ class User(DbBase):
         Returns:
             list[str]: The access tokens of the user.
         """
+        # Serve the cached Tokens object while it is fresh; serializing a user touches this
+        # property repeatedly and each miss costs a SELECT round trip
+        if self._accessTokensCache is not None and monotonic() - self._accessTokensCache[0] < self._accessTokensTtl:
+            return self._accessTokensCache[1]
+
         # This is a special case, as it requires a database operation to get the tokens
         with self._connection.cursor(cursor_factory=RealDictCursor) as cursor:
             cursor.execute(
@@ -261,14 +488,27 @@ class User(DbBase):
                 (self.id,)
             )
             rows: list[RealDictRow] = cursor.fetchall()
-            return Tokens(
-                rows,
-                self._connection,
-                self._config.tokenExpireTime,
-                self._config.jwtSecret,
-                self.id,
-                self.email
-            )
+
+        tokens: Tokens = Tokens(
+            rows,
+            self._connection,
+            self._config.tokenExpireSeconds,
+            self._config.jwtSecret,
+            self.id,
+            self.email,
+            user=self
+        )
+        self._accessTokensCache = (monotonic(), tokens)
+        return tokens
+
+    def invalidateAccessTokens(self) -> None:
+        """
+        Drops the cached Tokens object so the next accessTokens read hits the database.
+
+        Returns:
+            None
+        """
+        self._accessTokensCache = None
 
     @property
     def oauthScopes(self) -> list[str]:
@@ -296,6 +536,7 @@ class User(DbBase):
         """
         self._set("oauth_scopes", oauthScopes)
         self._oauthScopes = oauthScopes
+        self._invalidateSerialized()
 
     """
 ================================================================================================================================================================
@@ -310,18 +551,24 @@ class User(DbBase):
         Returns:
             dict: The user as a dictionary.
         """
-        return {
+        # Serve the cached form when no setter has fired since it was built
+        if self._dictCache is not None:
+            return self._dictCache
+
+        # Read the backing fields directly rather than through the property descriptors
+        self._dictCache = {
             "id": self.id,
             "createdAt": self.createdAt,
-            "uuid": self.uuid,
-            "email": self.email,
-            "username": self.username,
-            "accessLevel": self.accessLevel,
-            "banned": self.banned,
-            "refreshToken": self.refreshToken,
+            "uuid": self._uuid,
+            "email": self._email,
+            "username": self._username,
+            "accessLevel": self._accessLevel,
+            "banned": self._accessLevel == -1,
+            "refreshToken": self._refreshToken,
             "accessTokens": self.accessTokens,
-            "oauthScopes": self.oauthScopes
+            "oauthScopes": self._oauthScopes
         }
+        return self._dictCache
 
     def __str__(self) -> str:
         """
@@ -347,6 +594,19 @@ class User(DbBase):
 ================================================================================================================================================================
     """
 
+    def _hasher(self) -> "PasswordHasher":
+        """
+        Returns the argon2id hasher tuned from this user's config.
+
+        Returns:
+            PasswordHasher: The argon2id hasher.
+        """
+        return _argon2Hasher(
+            self._config.argon2TimeCost,
+            self._config.argon2MemoryCost,
+            self._config.argon2Parallelism
+        )
+
     def checkPassword(
             self,
             password: str
@@ -360,7 +620,53 @@ class User(DbBase):
         Returns:
             bool: True if the password is correct, False otherwise.
         """
-        return self._context.verify(password, self._password)
+        # A successful pbkdf2 verify costs tens of milliseconds; serve repeats from the cache
+        key: tuple[str, bytes, str] = (self._uuid, sha256(password.encode()).digest(), self._password)
+        now: float = monotonic()
+        with self._verifyCacheLock:
+            deadline: float | None = self._verifyCache.get(key)
+            if deadline is not None and now < deadline:
+                return True
+
+        # Verify against whichever scheme the stored hash uses: argon2id for current hashes,
+        # the C pbkdf2 path for legacy ones, passlib for anything else in the column
+        if self._password.startswith("$argon2"):
+            from argon2.exceptions import InvalidHashError, VerificationError
+
+            # InvalidHashError means the stored row is truncated or corrupt; like the unknown-hash
+            # case below, that is a failed login, not a 500
+            try:
+                self._hasher().verify(self._password, password)
+                verified: bool = True
+            except (VerificationError, InvalidHashError):
+                verified = False
+        elif self._password.startswith("$pbkdf2-sha512$"):
+            verified = _verifyPbkdf2(password, self._password)
+        else:
+            from passlib.exc import UnknownHashError
+
+            # A hash in a scheme the context does not know (e.g. a hand-edited row) is a failed
+            # login, not a 500
+            try:
+                verified = _pwContext().verify(password, self._password)
+            except UnknownHashError:
+                verified = False
+
+        if not verified:
+            return False  # Failures are never cached
+
+        # Transparently upgrade legacy hashes to argon2id on successful login
+        if not self._password.startswith("$argon2"):
+            upgraded: str = self._hasher().hash(password)
+            self._set("password", upgraded)
+            self._password = upgraded
+            key = (self._uuid, key[1], upgraded)
+
+        with self._verifyCacheLock:
+            if len(self._verifyCache) >= self._verifyCacheMax:
+                self._verifyCache.clear()
+            self._verifyCache[key] = now + self._verifyCacheTtl
+        return True
 
     def toModel(self) -> UserModel:
         """
@@ -369,13 +675,20 @@ class User(DbBase):
         Returns:
             UserModel: The user model.
         """
-        return UserModel(
+        # Serve the cached model when no setter has fired since it was built
+        if self._modelCache is not None:
+            return self._modelCache
+
+        # The values came straight from the database, so skip pydantic validation and the
+        # property descriptors on this hot serialization path
+        self._modelCache = UserModel.model_construct(
             id=self.id,
             createdAt=self.createdAt,
-            uuid=self.uuid,
-            email=self.email,
-            username=self.username,
-            accessLevel=self.accessLevel,
-            refreshToken=self.refreshToken,
-            oauthScopes=self.oauthScopes
+            uuid=self._uuid,
+            email=self._email,
+            username=self._username,
+            accessLevel=self._accessLevel,
+            refreshToken=self._refreshToken,
+            oauthScopes=self._oauthScopes
         )
+        return self._modelCache
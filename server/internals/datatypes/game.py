@@ -4,7 +4,7 @@ Game data type
 
 # Local Imports
 from .board import Board
-from server.internals.datatypes.db.user import User
+from .db.user import User
 
 
 class Game:
@@ -12,11 +12,7 @@ class Game:
     Represents a game instance. Contains users and associated boards.
     """
     # Type hints
-    boardKey: str
-    boardWidth: int
-    boardHeight: int
-    mineProbability: float
-    time
+    id: int
     users: list[User]
     boards: list[Board]
 
@@ -39,4 +35,4 @@ class Game:
         """
         self.id = id
         self.users = users
-        self.boards = boards
\ No newline at end of file
+        self.boards = boards
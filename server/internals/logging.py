@@ -187,7 +187,7 @@ class DatabaseHandler(Handler):
                 (
                     record.levelno,
                     record.name,
-                    record.msg
+                    record.getMessage()  # Applies deferred %s args; record.msg is just the template
                 )
             )
             self._connection.commit()
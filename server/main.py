@@ -1,34 +1,79 @@
 """
 Main file for the project
 """
-from datetime import time, datetime
+from atexit import register as atexitRegister
+from string import ascii_lowercase, ascii_uppercase, digits
+from time import monotonic, time
 # Standard Library Imports
 from typing import Any, Annotated
 
 # Third Party Imports
-from fastapi import FastAPI, Response, status, Depends, HTTPException
+from anyio.to_thread import run_sync as runSync
+from fastapi import FastAPI, Request, Response, status, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from jose import JWTError, jwt
+from jwt import PyJWTError, decode as jwtDecode
+from orjson import dumps as orjsonDumps
 
 # Local Imports
-from internals import Config, Database
+from internals import Config, Database, getConfig
 from internals.datatypes.db import Game, Token, Tokens, User, GameModel, TokenModel, UserModel
+from internals.datatypes.db.user import onCredentialChange
 from internals.logging import createLogger, SuppressedLoggerAdapter
 
-# Create the FastAPI app
-app: FastAPI = FastAPI()
+# Create the FastAPI app; orjson serializes responses in C rather than with the stdlib encoder
+app: FastAPI = FastAPI(default_response_class=ORJSONResponse)
 
 # Create the OAuth2 password bearer
 oauth2Scheme: OAuth2PasswordBearer = OAuth2PasswordBearer(tokenUrl="token")
 
+# Character classes for password complexity checks, precomputed once
+_DIGITS: frozenset = frozenset(digits)
+_LOWER: frozenset = frozenset(ascii_lowercase)
+_UPPER: frozenset = frozenset(ascii_uppercase)
+_ASCII: frozenset = frozenset(map(chr, range(128)))
+
 # Create the internals objects
-config: Config = Config()
+config: Config = getConfig()
 database: Database = Database(config)
+
+# Bound once at import; the signing key is read on every authenticated request
+SECRET_KEY: bytes = config.jwtSecretBytes
 logger: SuppressedLoggerAdapter = createLogger(
     "Main",
-    databaseConnection=database.connection
+    databaseConnection=database.loggerConnection
 )
 
+# Close the pool deterministically at shutdown rather than relying on GC finalizers
+atexitRegister(database.close)
+
+
+@app.middleware("http")
+async def _transactionBoundary(request: Request, call_next) -> Response:
+    """
+    Commits the shared connection once per request.
+
+    Token operations no longer commit individually; batching their writes into the request
+    transaction means one WAL flush per request instead of one per operation. Every async
+    handler writes to the same shared connection, so a boundary commit also covers whatever
+    other in-flight requests have written so far; for that same reason this middleware must
+    never roll back — doing so on one request's failure would silently discard another
+    request's work (e.g. a token row whose token was already returned to its client). A failed
+    request's partial writes are therefore committed rather than discarded. Log records are
+    unaffected; the database log handler commits on its own dedicated connection.
+
+    Args:
+        request (Request): The incoming request.
+        call_next: The next handler in the middleware chain.
+
+    Returns:
+        Response: The response from the handler.
+    """
+    try:
+        return await call_next(request)
+    finally:
+        database.connection.commit()
+
 
 """
 ================================================================================================================================================================
@@ -37,11 +82,46 @@ logger: SuppressedLoggerAdapter = createLogger(
 """
 
 
-async def currentUser(token: Annotated[str, Depends(oauth2Scheme)]) -> User | None:
+# Cache of verified tokens to their decoded payload and resolved user; the same token repeats
+# on every request of a session, so this turns a signature check plus a SELECT per request into
+# one per token per TTL window
+_TOKEN_CACHE_TTL: float = 60.0
+_TOKEN_CACHE_MAX: int = 8192
+_tokenCache: dict[str, tuple[float, dict[str, Any], User]] = {}
+
+
+def _evictUserTokens(uuid: str) -> None:
+    """
+    Drops every cached token entry for the given user.
+
+    Registered as a credential-change hook so password changes, bans and access-level edits take
+    effect on the next request instead of after the cache TTL.
+
+    Args:
+        uuid (str): The uuid of the changed user.
+
+    Returns:
+        None
+    """
+    for token in [token for token, entry in _tokenCache.items() if entry[2].uuid == uuid]:
+        _tokenCache.pop(token, None)
+
+
+onCredentialChange(_evictUserTokens)
+
+
+async def currentUser(
+        request: Request,
+        token: Annotated[str, Depends(oauth2Scheme)]
+) -> User | None:
     """
     Returns the current user.
 
+    The resolved user is also stashed on request.state so handlers further down the chain can
+    reuse it without a second lookup.
+
     Args:
+        request (Request): The incoming request.
         token (str): The token for the user.
 
     Returns:
@@ -58,42 +138,60 @@ async def currentUser(token: Annotated[str, Depends(oauth2Scheme)]) -> User | No
         headers={"WWW-Authenticate": "Bearer"}
     )
 
-    # Decode the token
-    try:
-        payload: dict[str, Any] = jwt.decode(token, config.jwtSecret, algorithms=["HS256"])
-        email: str = payload.get("sub")
-        if email is None:
-            logger.error("Missing sub in token.")
-            raise tokenError
-    except JWTError as e:
-        logger.error("Error decoding token.", exc_info=e)
+    # Reject obvious garbage in O(1) before paying for base64 decode, JSON parse and HMAC;
+    # scanner noise never gets past this line
+    if not token or token.count(".") != 2 or len(token) > 4096:
         raise tokenError
 
-    # Ensure that the token is not expired
-    if payload["exp"] < int(datetime.now().timestamp()):  # This is almost definitely going to throw an error
+    # Serve from the cache while the entry is fresh; expiry is re-checked below, and credential
+    # changes (password, ban, access level) evict the user's entries via _evictUserTokens
+    cached: tuple[float, dict[str, Any], User] | None = _tokenCache.get(token)
+    if cached is not None and monotonic() < cached[0]:
+        payload: dict[str, Any] = cached[1]
+        user: User = cached[2]
+    else:
+        # Decode the token
+        try:
+            payload = jwtDecode(token, SECRET_KEY, algorithms=["HS256"], options={"require": ["exp", "sub"]})
+            email: str = payload.get("sub")
+            if email is None:
+                logger.error("Missing sub in token.")
+                raise tokenError
+        except PyJWTError as e:
+            logger.error("Error decoding token.", exc_info=e)
+            raise tokenError
+
+        user = database.getUserByToken(token)
+
+        if not user:
+            raise tokenError
+
+        # Ensure that the user returned is the same user as the one in the token
+        if user.email != email:
+            raise tokenError
+
+        # Cache the verified pair, clamping the entry lifetime to the token's own expiry
+        if len(_tokenCache) >= _TOKEN_CACHE_MAX:
+            _tokenCache.clear()
+        remaining: float = payload["exp"] - time()
+        _tokenCache[token] = (monotonic() + min(_TOKEN_CACHE_TTL, remaining), payload, user)
+
+    # Ensure that the token is not expired; time() avoids building a datetime per request
+    if payload["exp"] < time():
+        _tokenCache.pop(token, None)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Token expired.",
             headers={"WWW-Authenticate": "Bearer"}
         )
 
-    user: User = database.getUser(
-        token=token
-    )
-
-    if not user:
-        raise tokenError
-
-    # Ensure that the user returned is the same user as the one in the token
-    if user.email != email:
-        raise tokenError
-
     if user.banned:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="User is banned."
         )
 
+    request.state.user = user
     return user
 
 
@@ -104,16 +202,29 @@ async def currentUser(token: Annotated[str, Depends(oauth2Scheme)]) -> User | No
 """
 
 
+# The spec is deterministic, so it is serialized once on the first request (after every route
+# has been registered) and served as raw bytes from then on
+_specBytes: bytes | None = None
+
+
 @app.options("/")
 @app.get("/")
-async def _spec() -> dict[str, Any]:
+async def _spec() -> Response:
     """
     Returns the OpenAPI specification.
 
     Returns:
-        dict[str, str]: The OpenAPI specification.
+        Response: The pre-serialized OpenAPI specification.
     """
-    return app.openapi()
+    global _specBytes
+    if _specBytes is None:
+        _specBytes = orjsonDumps(app.openapi())
+
+    return Response(
+        content=_specBytes,
+        media_type="application/json",
+        headers={"Cache-Control": "public, max-age=3600"}
+    )
 
 
 """
@@ -123,7 +234,9 @@ async def _spec() -> dict[str, Any]:
 """
 
 
-@app.get("/game", status_code=200, response_model=GameModel)
+# response_model is deliberately omitted: toModel() already builds the validated model, and
+# declaring it would make FastAPI re-validate the output; responses= keeps the schema in the docs
+@app.get("/game", status_code=200, response_model=None, responses={200: {"model": GameModel}})
 async def _getGame(
         response: Response,
         user: Annotated[User, Depends(currentUser)],
@@ -192,8 +305,9 @@ async def _loginUser(
             detail="User not found."
         )
 
-    # Check the password
-    if not user.checkPassword(formData.password):
+    # Check the password in a worker thread; the KDF costs tens of milliseconds of pure CPU and
+    # would otherwise stall every other request on the event loop
+    if not await runSync(user.checkPassword, formData.password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid credentials.",
@@ -227,9 +341,7 @@ async def _refreshToken(
         dict[str, Any]: The new access token.
     """
     # Get the user
-    user: User | None = database.getUser(
-        token=refreshToken
-    )
+    user: User | None = database.getUserByToken(refreshToken)
 
     # Check if the user exists
     if user is None:
@@ -243,7 +355,7 @@ async def _refreshToken(
     }
 
 
-@app.get("/user", status_code=200, response_model=UserModel)
+@app.get("/user", status_code=200, response_model=None, responses={200: {"model": UserModel}})
 async def _getUser(
         response: Response,
         user: Annotated[User, Depends(currentUser)],
@@ -278,6 +390,16 @@ async def _getUser(
             detail="User is not authorized to view users."
         )
 
+    # Serve the current user directly when the lookup targets them; currentUser already paid
+    # the SELECT for this request
+    if (
+            (userId is not None or uuid is not None or email is not None)
+            and (userId is None or userId == user.id)
+            and (uuid is None or uuid == user.uuid)
+            and (email is None or email == user.email)
+    ):
+        return user.toModel()
+
     # Get the user
     user: User = database.getUser(
         userId,
@@ -319,20 +441,23 @@ async def _createUser(
         response.status_code = status.HTTP_400_BAD_REQUEST
         return {"error": "Password must be at least 8 characters."}
 
-    # Ensure that at least 1 of each type of character is in the password
-    if not any(char.isdigit() for char in password):
+    # Ensure that at least 1 of each type of character is in the password; one C-level set
+    # construction plus four disjointness tests replaces per-character Python dispatch
+    chars: set = set(password)
+
+    if chars.isdisjoint(_DIGITS):
         response.status_code = status.HTTP_400_BAD_REQUEST
         return {"error": "Password must contain at least 1 number."}
 
-    if not any(char.islower() for char in password):
+    if chars.isdisjoint(_LOWER):
         response.status_code = status.HTTP_400_BAD_REQUEST
         return {"error": "Password must contain at least 1 lowercase letter."}
 
-    if not any(char.isupper() for char in password):
+    if chars.isdisjoint(_UPPER):
         response.status_code = status.HTTP_400_BAD_REQUEST
         return {"error": "Password must contain at least 1 uppercase letter."}
 
-    if not any(char.isascii() for char in password):  # This might not work as expected
+    if chars.isdisjoint(_ASCII):  # This might not work as expected
         response.status_code = status.HTTP_400_BAD_REQUEST
         return {"error": "Password must contain at least 1 special character."}
 